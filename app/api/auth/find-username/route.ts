@@ -21,12 +21,9 @@ export async function POST(request: Request) {
         const summary = await getUserSummary(username);
 
         if (!summary) {
-          console.log(`  Skipping @${username}: no summary data`);
           continue;
         }
 
-        console.log(`  Checking @${username}: accountId = "${summary.accountId}"`);
-
         // Check if this user's account ID matches the Twitter ID
         if (summary.accountId === twitterId) {
           console.log(`✅ Found match! Username: ${username}`);
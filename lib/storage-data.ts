@@ -204,6 +204,12 @@ const fetchObjectBuffer = async (key: string): Promise<Buffer | null> => {
   }
 };
 
+// Drops a cached object body once a caller holds a decoded copy that is cached on its own.
+const releaseObjectBuffer = async (key: string) => {
+  const bucket = await getBucketName();
+  objectCache.delete(`${bucket}:${key}`);
+};
+
 const readJsonFile = async <T>(username: string, filename: string): Promise<T | null> => {
   const key = `${username}/${filename}`;
   const buffer = await fetchObjectBuffer(key);
@@ -241,22 +247,37 @@ const normalizeArrowValue = (value: unknown): unknown => {
   return value;
 };
 
-const readParquetRecords = async (
+type ParquetColumns = {
+  rowCount: number;
+  columns: Record<string, unknown[]>;
+};
+
+const readParquetColumns = async (
   username: string,
   filename: string,
   columns?: string[],
-): Promise<Record<string, unknown>[]> => {
+): Promise<ParquetColumns | null> => {
   const key = `${username}/${filename}`;
   const buffer = await fetchObjectBuffer(key);
   if (!buffer) {
-    return [];
+    return null;
   }
-
+  // Loaded only once an object came back, so a missing file never pulls in the wasm/Arrow modules.
   const { parquet, arrow } = await loadParquetEnvironment();
 
+  const projection = columns && columns.length > 0 ? columns : null;
+
   let table;
   try {
-    table = parquet.readParquet(buffer);
+    try {
+      table = projection ? parquet.readParquet(buffer, { columns: projection }) : parquet.readParquet(buffer);
+    } catch (projectionError) {
+      // Older exports may lack some of the requested columns; fall back to a full read.
+      if (!projection) {
+        throw projectionError;
+      }
+      table = parquet.readParquet(buffer);
+    }
   } catch (error) {
     const message = error instanceof Error ? error.message : String(error);
     throw new Error(`Failed to read Parquet file "${key}": ${message}`);
@@ -265,19 +286,40 @@ const readParquetRecords = async (
   const ipcStream = table.intoIPCStream();
   const arrowTable = arrow.tableFromIPC(ipcStream);
 
-  const targetFields =
-    columns && columns.length > 0
-      ? columns
-      : arrowTable.schema.fields.map((field) => field.name);
+  const targetFields = projection ?? arrowTable.schema.fields.map((field) => field.name);
+  const rowCount = arrowTable.numRows;
 
-  const rows: Record<string, unknown>[] = [];
+  const columnValues: Record<string, unknown[]> = {};
+  for (const fieldName of targetFields) {
+    const vector = arrowTable.getChild(fieldName);
+    const values: unknown[] = new Array(rowCount);
+    for (let index = 0; index < rowCount; index += 1) {
+      values[index] = vector ? normalizeArrowValue(vector.get(index)) : null;
+    }
+    columnValues[fieldName] = values;
+  }
 
-  for (const row of arrowTable as Iterable<Record<string, unknown>>) {
+  return { rowCount, columns: columnValues };
+};
+
+const readParquetRecords = async (
+  username: string,
+  filename: string,
+  columns?: string[],
+): Promise<Record<string, unknown>[]> => {
+  const parsed = await readParquetColumns(username, filename, columns);
+  if (!parsed) {
+    return [];
+  }
+
+  const fieldNames = Object.keys(parsed.columns);
+  const rows: Record<string, unknown>[] = new Array(parsed.rowCount);
+  for (let index = 0; index < parsed.rowCount; index += 1) {
     const record: Record<string, unknown> = {};
-    for (const fieldName of targetFields) {
-      record[fieldName] = normalizeArrowValue(row[fieldName]);
+    for (const fieldName of fieldNames) {
+      record[fieldName] = parsed.columns[fieldName]![index];
     }
-    rows.push(record);
+    rows[index] = record;
   }
 
   return rows;
@@ -342,16 +384,23 @@ const readNpyArray = async (username: string, filename: string): Promise<ParsedN
   }
 
   const payload = buffer.subarray(headerEnd);
-  const payloadBuffer = payload.buffer.slice(
-    payload.byteOffset,
-    payload.byteOffset + payload.byteLength,
-  );
+  // View the payload in place when it is aligned for the element type; only copy when it is not.
+  const copyPayload = () =>
+    payload.buffer.slice(payload.byteOffset, payload.byteOffset + payload.byteLength);
 
   let typed: Float32Array | Float64Array;
   if (descr === "<f4" || descr === "|f4" || descr === "f4") {
-    typed = new Float32Array(payloadBuffer);
+    typed =
+      payload.byteOffset % Float32Array.BYTES_PER_ELEMENT === 0 &&
+      payload.byteLength % Float32Array.BYTES_PER_ELEMENT === 0
+        ? new Float32Array(payload.buffer, payload.byteOffset, payload.byteLength / Float32Array.BYTES_PER_ELEMENT)
+        : new Float32Array(copyPayload());
   } else if (descr === "<f8" || descr === "|f8" || descr === "f8") {
-    typed = new Float64Array(payloadBuffer);
+    typed =
+      payload.byteOffset % Float64Array.BYTES_PER_ELEMENT === 0 &&
+      payload.byteLength % Float64Array.BYTES_PER_ELEMENT === 0
+        ? new Float64Array(payload.buffer, payload.byteOffset, payload.byteLength / Float64Array.BYTES_PER_ELEMENT)
+        : new Float64Array(copyPayload());
   } else {
     throw new Error(`Unsupported dtype "${descr}" in "${key}"`);
   }
@@ -588,13 +637,24 @@ const convertPickleValue = (value: unknown, seen: WeakMap<object, unknown>): unk
     return target;
   }
 
+  // The parser hands us a freshly built graph, so arrays and plain objects are converted in place
+  // rather than copied node by node.
   if (Array.isArray(value)) {
-    const list: unknown[] = [];
-    seen.set(value, list);
-    for (const entry of value) {
-      list.push(convertPickleValue(entry, seen));
+    seen.set(value, value);
+    for (let index = 0; index < value.length; index += 1) {
+      value[index] = convertPickleValue(value[index], seen);
+    }
+    return value;
+  }
+
+  const prototype = Object.getPrototypeOf(value);
+  if (prototype === Object.prototype || prototype === null) {
+    const target = value as Record<string, unknown>;
+    seen.set(value, target);
+    for (const key of Object.keys(target)) {
+      target[key] = convertPickleValue(target[key], seen);
     }
-    return list;
+    return target;
   }
 
   const source = value as Record<string, unknown>;
@@ -655,6 +715,70 @@ const sanitizeNumber = (value: unknown): number => {
   return 0;
 };
 
+const sanitizeStringColumn = (values: unknown[]): string[] => {
+  const result: string[] = new Array(values.length);
+  for (let index = 0; index < values.length; index += 1) {
+    result[index] = sanitizeString(values[index]);
+  }
+  return result;
+};
+
+// Dictionary-style variant for low-cardinality columns (authoring accounts, clusters, author handles):
+// each distinct raw value is sanitized once and every row shares the resulting string.
+const sanitizeDictionaryColumn = (values: unknown[]): string[] => {
+  const dictionary = new Map<unknown, string>();
+  const result: string[] = new Array(values.length);
+  for (let index = 0; index < values.length; index += 1) {
+    const value = values[index];
+    let sanitized = dictionary.get(value);
+    if (sanitized === undefined) {
+      sanitized = sanitizeString(value);
+      dictionary.set(value, sanitized);
+    }
+    result[index] = sanitized;
+  }
+  return result;
+};
+
+const sanitizeNumberColumn = (values: unknown[]): Float64Array => {
+  const result = new Float64Array(values.length);
+  for (let index = 0; index < values.length; index += 1) {
+    const value = values[index];
+    result[index] = typeof value === "number" && Number.isFinite(value) ? value : sanitizeNumber(value);
+  }
+  return result;
+};
+
+const normalizeTimestampColumn = (
+  values: unknown[],
+): { createdAt: (string | null)[]; createdAtMs: (number | null)[] } => {
+  const createdAt: (string | null)[] = new Array(values.length);
+  const createdAtMs: (number | null)[] = new Array(values.length);
+  for (let index = 0; index < values.length; index += 1) {
+    const rawCreatedAt = values[index];
+    createdAt[index] = null;
+    createdAtMs[index] = null;
+
+    if (rawCreatedAt instanceof Date && !Number.isNaN(rawCreatedAt.getTime())) {
+      createdAtMs[index] = rawCreatedAt.getTime();
+      createdAt[index] = rawCreatedAt.toISOString();
+      continue;
+    }
+    const createdAtText = sanitizeString(rawCreatedAt);
+    if (!createdAtText) {
+      continue;
+    }
+    const parsed = Date.parse(createdAtText);
+    if (Number.isFinite(parsed)) {
+      createdAtMs[index] = parsed;
+      createdAt[index] = new Date(parsed).toISOString();
+    } else {
+      createdAt[index] = createdAtText;
+    }
+  }
+  return { createdAt, createdAtMs };
+};
+
 type NormalizedTweetRow = {
   tweetId: string;
   accountId: string;
@@ -684,6 +808,8 @@ const TWEET_ROW_COLUMNS = [
   "full_text",
 ];
 
+const HIERARCHY_COLUMNS = ["cluster_id", "name", "summary", "low_quality_cluster", "level"];
+
 const tweetRowsCache = new Map<string, Promise<NormalizedTweetRow[]>>();
 const embeddingsCache = new Map<string, Promise<UserEmbeddings | null>>();
 
@@ -699,59 +825,44 @@ const loadTweetRows = async (username: string): Promise<NormalizedTweetRow[]> =>
   }
 
   const promise = (async () => {
-    const rows = await readParquetRecords(normalizedUsername, "clustered_tweets_df.parquet", TWEET_ROW_COLUMNS);
-    if (!rows.length) {
+    const parsed = await readParquetColumns(normalizedUsername, "clustered_tweets_df.parquet", TWEET_ROW_COLUMNS);
+    if (!parsed || !parsed.rowCount) {
       return [] as NormalizedTweetRow[];
     }
+    // tweetRowsCache keeps the normalized rows; the raw Parquet bytes are no longer needed.
+    await releaseObjectBuffer(`${normalizedUsername}/clustered_tweets_df.parquet`);
+
+    const { rowCount, columns } = parsed;
+    const column = (name: string): unknown[] => columns[name] ?? new Array(rowCount).fill(null);
+    const tweetIds = sanitizeStringColumn(column("tweet_id"));
+    const accountIds = sanitizeDictionaryColumn(column("account_id"));
+    const clusters = sanitizeDictionaryColumn(column("cluster"));
+    const clusterProbs = sanitizeNumberColumn(column("cluster_prob"));
+    const favoriteCounts = sanitizeNumberColumn(column("favorite_count"));
+    const replyToUserIds = sanitizeStringColumn(column("reply_to_user_id"));
+    const replyToUsernames = sanitizeStringColumn(column("reply_to_username"));
+    const replyToTweetIds = sanitizeStringColumn(column("reply_to_tweet_id"));
+    const usernames = sanitizeDictionaryColumn(column("username"));
+    const fullTexts = sanitizeStringColumn(column("full_text"));
+    const { createdAt, createdAtMs } = normalizeTimestampColumn(column("created_at"));
+
+    const normalizedRows: NormalizedTweetRow[] = new Array(rowCount);
 
-    const normalizedRows: NormalizedTweetRow[] = [];
-
-    for (const row of rows) {
-      const tweetId = sanitizeString(row["tweet_id"]);
-      const accountId = sanitizeString(row["account_id"]);
-      const clusterId = sanitizeString(row["cluster"]);
-      const clusterProb = sanitizeNumber(row["cluster_prob"]);
-      const favoriteCount = Math.round(sanitizeNumber(row["favorite_count"]));
-      const replyToUserId = sanitizeString(row["reply_to_user_id"]);
-      const replyToUsername = sanitizeString(row["reply_to_username"]);
-      const replyToTweetId = sanitizeString(row["reply_to_tweet_id"]);
-      const usernameValue = sanitizeString(row["username"]);
-      const fullText = sanitizeString(row["full_text"]);
-
-      const rawCreatedAt = row["created_at"];
-      let createdAt: string | null = null;
-      let createdAtMs: number | null = null;
-
-      if (rawCreatedAt instanceof Date && !Number.isNaN(rawCreatedAt.getTime())) {
-        createdAtMs = rawCreatedAt.getTime();
-        createdAt = rawCreatedAt.toISOString();
-      } else {
-        const createdAtText = sanitizeString(rawCreatedAt);
-        if (createdAtText) {
-          const parsed = Date.parse(createdAtText);
-          if (Number.isFinite(parsed)) {
-            createdAtMs = parsed;
-            createdAt = new Date(parsed).toISOString();
-          } else {
-            createdAt = createdAtText;
-          }
-        }
-      }
-
-      normalizedRows.push({
-        tweetId,
-        accountId,
-        clusterId,
-        clusterProb,
-        favoriteCount,
-        replyToUserId,
-        replyToUsername,
-        replyToTweetId,
-        username: usernameValue,
-        fullText,
-        createdAt,
-        createdAtMs,
-      });
+    for (let index = 0; index < rowCount; index += 1) {
+      normalizedRows[index] = {
+        tweetId: tweetIds[index]!,
+        accountId: accountIds[index]!,
+        clusterId: clusters[index]!,
+        clusterProb: clusterProbs[index]!,
+        favoriteCount: Math.round(favoriteCounts[index]!),
+        replyToUserId: replyToUserIds[index]!,
+        replyToUsername: replyToUsernames[index]!,
+        replyToTweetId: replyToTweetIds[index]!,
+        username: usernames[index]!,
+        fullText: fullTexts[index]!,
+        createdAt: createdAt[index] ?? null,
+        createdAtMs: createdAtMs[index] ?? null,
+      };
     }
 
     return normalizedRows;
@@ -771,8 +882,33 @@ const loadTweetRows = async (username: string): Promise<NormalizedTweetRow[]> =>
   }
 };
 
+// Maps each row's account id to a dense integer code (-1 when missing) so per-account tallies can
+// run over flat typed arrays instead of string-keyed maps.
+const encodeAccountIds = (rows: NormalizedTweetRow[]): { codes: Int32Array; accountIds: string[] } => {
+  const codes = new Int32Array(rows.length);
+  const accountIds: string[] = [];
+  const lookup = new Map<string, number>();
+  for (let index = 0; index < rows.length; index += 1) {
+    const accountId = rows[index]!.accountId;
+    if (!accountId) {
+      codes[index] = -1;
+      continue;
+    }
+    let code = lookup.get(accountId);
+    if (code === undefined) {
+      code = accountIds.length;
+      lookup.set(accountId, code);
+      accountIds.push(accountId);
+    }
+    codes[index] = code;
+  }
+  return { codes, accountIds };
+};
+
 type SharedTweetRowsOptions = {
   tweetRows?: NormalizedTweetRow[] | null;
+  // Parsed group_results.json shared within one bundle request; `null` means the file is missing.
+  groupData?: Record<string, unknown> | null;
 };
 
 type SummaryComputationOptions = SharedTweetRowsOptions & {
@@ -886,146 +1022,213 @@ const medianNumber = (values: number[]): number => {
   if (!values.length) {
     return 0;
   }
-  const sorted = [...values].sort((a, b) => a - b);
+  const sorted = Float64Array.from(values).sort();
   const mid = Math.floor(sorted.length / 2);
   if (sorted.length % 2 === 0) {
-    return (sorted[mid - 1] + sorted[mid]) / 2;
+    return (sorted[mid - 1]! + sorted[mid]!) / 2;
   }
-  return sorted[mid];
+  return sorted[mid]!;
 };
 
 const medianDateIso = (timestamps: number[]): string | null => {
   if (!timestamps.length) {
     return null;
   }
-  const sorted = [...timestamps].sort((a, b) => a - b);
+  const sorted = Float64Array.from(timestamps).sort();
   const mid = Math.floor(sorted.length / 2);
-  const median = sorted[mid];
+  const median = sorted[mid]!;
   if (!Number.isFinite(median)) {
     return null;
   }
   return new Date(median).toISOString();
 };
 
-const normalizeOntology = (value: unknown): ClusterOntology => {
-  const fallback: ClusterOntology = {
-    entities: [],
-    beliefsAndValues: [],
-    goals: [],
-    socialRelationships: [],
-    moodsAndEmotionalTones: [],
-    keyConcepts: [],
-  };
-  if (!value || typeof value !== "object") {
-    return fallback;
+// Sorts newest first with undated items last, parsing each date once rather than per comparison.
+const sortByDateDescending = <T>(items: T[], getDate: (item: T) => string | null): T[] => {
+  const keyed = items.map((item) => {
+    const date = getDate(item);
+    return { item, hasDate: date ? 1 : 0, time: date ? Date.parse(date) : 0 };
+  });
+  keyed.sort((a, b) => {
+    if (a.hasDate !== b.hasDate) {
+      return b.hasDate - a.hasDate;
+    }
+    if (!a.hasDate) {
+      return 0;
+    }
+    return b.time - a.time;
+  });
+  for (let index = 0; index < keyed.length; index += 1) {
+    items[index] = keyed[index]!.item;
   }
-  const source = value as Record<string, unknown>;
+  return items;
+};
 
-  const slice = <T>(
-    raw: unknown,
-    mapper: (entry: Record<string, unknown>) => T | null,
-  ): T[] => {
-    if (!Array.isArray(raw)) {
-      return [];
+type OntologyFields = {
+  id: string;
+  primary: string;
+  secondary: string;
+  tweetReferences: string[];
+};
+
+// Shared filter/cap for every ontology category; `build` names the category's fields, so each call
+// site is type-checked against its ClusterOntology entry.
+const normalizeOntologyItems = <T>(
+  raw: unknown,
+  primaryKey: string,
+  secondaryKey: string,
+  build: (fields: OntologyFields) => T,
+): T[] => {
+  if (!Array.isArray(raw)) {
+    return [];
+  }
+  const bucket: T[] = [];
+  for (const entry of raw) {
+    if (!entry || typeof entry !== "object") {
+      continue;
     }
-    const bucket: T[] = [];
-    for (const entry of raw) {
-      if (!entry || typeof entry !== "object") {
-        continue;
-      }
-      const mapped = mapper(entry as Record<string, unknown>);
-      if (mapped) {
-        bucket.push(mapped);
-      }
-      if (bucket.length >= 4) {
-        break;
-      }
+    const record = entry as Record<string, unknown>;
+    const primary = sanitizeString(record[primaryKey]);
+    const secondary = sanitizeString(record[secondaryKey]);
+    if (primary || secondary) {
+      bucket.push(
+        build({
+          id: sanitizeString(record["id"]),
+          primary,
+          secondary,
+          tweetReferences: sanitizeStringArray(record["tweet_references"]),
+        }),
+      );
     }
-    return bucket;
-  };
+    if (bucket.length >= 4) {
+      break;
+    }
+  }
+  return bucket;
+};
+
+const normalizeOntology = (value: unknown): ClusterOntology => {
+  const source = value && typeof value === "object" ? (value as Record<string, unknown>) : {};
 
   return {
-    entities: slice(source["entities"], (entry) => {
-      const name = sanitizeString(entry["name"]);
-      const description = sanitizeString(entry["description"]);
-      if (!name && !description) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        name,
-        description,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
-    beliefsAndValues: slice(source["beliefs_and_values"], (entry) => {
-      const belief = sanitizeString(entry["belief"]);
-      const description = sanitizeString(entry["description"]);
-      if (!belief && !description) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        belief,
-        description,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
-    goals: slice(source["goals"], (entry) => {
-      const goal = sanitizeString(entry["goal"]);
-      const description = sanitizeString(entry["description"]);
-      if (!goal && !description) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        goal,
-        description,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
-    socialRelationships: slice(source["social_relationships"], (entry) => {
-      const username = sanitizeString(entry["username"]);
-      const interactionType = sanitizeString(entry["interaction_type"]);
-      if (!username && !interactionType) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        username,
-        interactionType,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
-    moodsAndEmotionalTones: slice(source["moods_and_emotional_tones"], (entry) => {
-      const mood = sanitizeString(entry["mood"]);
-      const description = sanitizeString(entry["description"]);
-      if (!mood && !description) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        mood,
-        description,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
-    keyConcepts: slice(source["key_concepts_and_ideas"], (entry) => {
-      const concept = sanitizeString(entry["concept"]);
-      const description = sanitizeString(entry["description"]);
-      if (!concept && !description) {
-        return null;
-      }
-      return {
-        id: sanitizeString(entry["id"]),
-        concept,
-        description,
-        tweetReferences: sanitizeStringArray(entry["tweet_references"]),
-      };
-    }),
+    entities: normalizeOntologyItems(
+      source["entities"],
+      "name",
+      "description",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        name: primary,
+        description: secondary,
+        tweetReferences,
+      }),
+    ),
+    beliefsAndValues: normalizeOntologyItems(
+      source["beliefs_and_values"],
+      "belief",
+      "description",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        belief: primary,
+        description: secondary,
+        tweetReferences,
+      }),
+    ),
+    goals: normalizeOntologyItems(
+      source["goals"],
+      "goal",
+      "description",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        goal: primary,
+        description: secondary,
+        tweetReferences,
+      }),
+    ),
+    socialRelationships: normalizeOntologyItems(
+      source["social_relationships"],
+      "username",
+      "interaction_type",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        username: primary,
+        interactionType: secondary,
+        tweetReferences,
+      }),
+    ),
+    moodsAndEmotionalTones: normalizeOntologyItems(
+      source["moods_and_emotional_tones"],
+      "mood",
+      "description",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        mood: primary,
+        description: secondary,
+        tweetReferences,
+      }),
+    ),
+    keyConcepts: normalizeOntologyItems(
+      source["key_concepts_and_ideas"],
+      "concept",
+      "description",
+      ({ id, primary, secondary, tweetReferences }) => ({
+        id,
+        concept: primary,
+        description: secondary,
+        tweetReferences,
+      }),
+    ),
   };
 };
 
+// Keeps the `limit` highest counts in descending order without sorting every entry. Ties keep
+// insertion order, matching a stable sort.
+const topCounts = (counts: Map<string, number>, limit: number): [string, number][] => {
+  const top: [string, number][] = [];
+  for (const [key, count] of counts) {
+    if (top.length >= limit && count <= top[top.length - 1]![1]) {
+      continue;
+    }
+    let position = top.length;
+    while (position > 0 && top[position - 1]![1] < count) {
+      position -= 1;
+    }
+    top.splice(position, 0, [key, count]);
+    if (top.length > limit) {
+      top.pop();
+    }
+  }
+  return top;
+};
+
+type ClusterReferenceTweet = {
+  tweetId: string;
+  username: string;
+  accountId: string;
+  createdAt: string | null;
+  fullText: string;
+  favoriteCount: number;
+};
+
+type ClusterStats = {
+  likes: number[];
+  totalLikes: number;
+  count: number;
+  timestamps: number[];
+  replies: Map<string, number>;
+  referenceTweets: Map<string, ClusterReferenceTweet>;
+};
+
+const createClusterStats = (): ClusterStats => ({
+  likes: [],
+  totalLikes: 0,
+  count: 0,
+  timestamps: [],
+  replies: new Map<string, number>(),
+  referenceTweets: new Map<string, ClusterReferenceTweet>(),
+});
+
+const EMPTY_ONTOLOGY: ClusterOntology = normalizeOntology({});
+
 const normalizeYearlySummaries = (value: unknown): { period: string; summary: string }[] => {
   if (!Array.isArray(value)) {
     return [];
@@ -1117,6 +1320,13 @@ export const listUsers = async (): Promise<string[]> => {
     continuationToken = response.IsTruncated ? response.NextContinuationToken : undefined;
   } while (continuationToken);
 
+  // The delimiter listing already proves each prefix exists, so later lookups can skip ensureUserExists' request.
+  for (const name of users) {
+    if (normalizeUsername(name) === name && !userExistenceCache.has(name)) {
+      userExistenceCache.set(name, Promise.resolve(true));
+    }
+  }
+
   return Array.from(users).sort((a, b) => a.localeCompare(b));
 };
 
@@ -1136,9 +1346,13 @@ export const getUserSummary = async (
     }
   }
 
-  const groupData = await readJsonFile<Record<string, unknown>>(username, "group_results.json");
-  const params = await readJsonFile<Record<string, unknown>>(username, "clustering_params.json");
-  const tweetRows = options?.tweetRows ?? (await loadTweetRows(username));
+  const [groupData, params, tweetRows] = await Promise.all([
+    options?.groupData !== undefined
+      ? options.groupData
+      : readJsonFile<Record<string, unknown>>(username, "group_results.json"),
+    readJsonFile<Record<string, unknown>>(username, "clustering_params.json"),
+    options?.tweetRows ?? loadTweetRows(username),
+  ]);
 
   let description = "";
   if (groupData && typeof groupData === "object") {
@@ -1151,41 +1365,56 @@ export const getUserSummary = async (
     clusters = Math.max(0, Math.round(sanitizeNumber((params as Record<string, unknown>)["n_clusters"])));
   }
 
-  const accountCounts = new Map<string, number>();
-  const followingIds = new Set<string>();
-  const followerIds = new Set<string>();
-  let likes = 0;
-  let tweets = 0;
-
-  for (const row of tweetRows) {
-    if (row.accountId) {
-      accountCounts.set(row.accountId, (accountCounts.get(row.accountId) ?? 0) + 1);
+  // Tally tweets and likes per authoring account over dense codes; the follower/following sets and
+  // month buckets are only built for the primary account once it is known.
+  const { codes: accountCodes, accountIds } = encodeAccountIds(tweetRows);
+  const accountTweets = new Uint32Array(accountIds.length);
+  const accountLikes = new Float64Array(accountIds.length);
+  for (let index = 0; index < accountCodes.length; index += 1) {
+    const code = accountCodes[index]!;
+    if (code < 0) {
+      continue;
     }
+    const favoriteCount = tweetRows[index]!.favoriteCount;
+    accountTweets[code] += 1;
+    accountLikes[code] += Number.isFinite(favoriteCount) ? favoriteCount : 0;
   }
 
-  let primaryAccount = "";
-  for (const [accountId, count] of accountCounts.entries()) {
-    if (!primaryAccount || count > (accountCounts.get(primaryAccount) ?? 0)) {
-      primaryAccount = accountId;
+  let primaryCode = -1;
+  for (let code = 0; code < accountTweets.length; code += 1) {
+    if (primaryCode < 0 || accountTweets[code]! > accountTweets[primaryCode]!) {
+      primaryCode = code;
     }
   }
+  const primaryAccount = primaryCode >= 0 ? accountIds[primaryCode]! : "";
 
-  if (primaryAccount) {
-    for (const row of tweetRows) {
-      const favoriteCount = Number.isFinite(row.favoriteCount) ? row.favoriteCount : 0;
+  const followingIds = new Set<string>();
+  const followerIds = new Set<string>();
+  const monthlyTimeline = new Map<number, number>();
 
-      if (row.accountId === primaryAccount) {
-        tweets += 1;
-        likes += favoriteCount;
+  if (primaryAccount) {
+    for (let index = 0; index < tweetRows.length; index += 1) {
+      const row = tweetRows[index]!;
+      if (accountCodes[index] === primaryCode) {
         if (row.replyToUserId && row.replyToUserId !== primaryAccount) {
           followingIds.add(row.replyToUserId);
         }
+        if (row.createdAtMs !== null) {
+          const date = new Date(row.createdAtMs);
+          if (!Number.isNaN(date.getTime())) {
+            const monthStart = Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1);
+            monthlyTimeline.set(monthStart, (monthlyTimeline.get(monthStart) ?? 0) + 1);
+          }
+        }
       } else if (row.replyToUserId === primaryAccount && row.accountId) {
         followerIds.add(row.accountId);
       }
     }
   }
 
+  let tweets = primaryCode >= 0 ? accountTweets[primaryCode]! : 0;
+  const likes = primaryCode >= 0 ? accountLikes[primaryCode]! : 0;
+
   if (tweets === 0) {
     const tweetMap = await readJsonFile<Record<string, Record<string, string>>>(
       username,
@@ -1193,12 +1422,13 @@ export const getUserSummary = async (
     );
     if (tweetMap && typeof tweetMap === "object") {
       const uniqueIds = new Set<string>();
-      for (const cluster of Object.values(tweetMap)) {
-        if (!cluster) {
+      for (const clusterKey in tweetMap) {
+        const cluster = tweetMap[clusterKey];
+        if (!cluster || typeof cluster !== "object") {
           continue;
         }
-        for (const tweetId of Object.values(cluster)) {
-          const normalized = sanitizeString(tweetId);
+        for (const localId in cluster) {
+          const normalized = sanitizeString(cluster[localId]);
           if (normalized) {
             uniqueIds.add(normalized);
           }
@@ -1218,35 +1448,9 @@ export const getUserSummary = async (
     }
   }
 
-  const monthlyTimeline = new Map<string, { count: number; monthStart: number }>();
-
-  if (primaryAccount) {
-    for (const row of tweetRows) {
-      if (row.accountId !== primaryAccount || row.createdAtMs === null) {
-        continue;
-      }
-
-      const date = new Date(row.createdAtMs);
-      if (Number.isNaN(date.getTime())) {
-        continue;
-      }
-
-      const year = date.getUTCFullYear();
-      const month = date.getUTCMonth();
-      const monthStart = Date.UTC(year, month, 1);
-      const bucketKey = `${year}-${month}`;
-      const existing = monthlyTimeline.get(bucketKey);
-      if (existing) {
-        existing.count += 1;
-      } else {
-        monthlyTimeline.set(bucketKey, { count: 1, monthStart });
-      }
-    }
-  }
-
-  const tweetsOverTime = Array.from(monthlyTimeline.values())
-    .sort((a, b) => a.monthStart - b.monthStart)
-    .map(({ monthStart, count }) => ({
+  const tweetsOverTime = Array.from(monthlyTimeline.entries())
+    .sort((a, b) => a[0] - b[0])
+    .map(([monthStart, count]) => ({
       month: new Date(monthStart).toISOString(),
       count,
     }));
@@ -1275,12 +1479,14 @@ export const getUserClusters = async (
     return null;
   }
 
-  const hierarchyRows = await readParquetRecords(username, "labeled_cluster_hierarchy.parquet", [
-    "cluster_id",
-    "name",
-    "summary",
-    "low_quality_cluster",
-    "level",
+  // Tweet rows are the largest object, so they are only fetched once the hierarchy is known to be non-empty.
+  const [hierarchyRows, ontologyData, groupData, tweetIdMapsData] = await Promise.all([
+    readParquetRecords(username, "labeled_cluster_hierarchy.parquet", HIERARCHY_COLUMNS),
+    readJsonFile<Record<string, unknown>>(username, "cluster_ontology_items.json"),
+    options?.groupData !== undefined
+      ? options.groupData
+      : readJsonFile<Record<string, unknown>>(username, "group_results.json"),
+    readJsonFile<Record<string, Record<string, string>>>(username, "local_tweet_id_maps.json"),
   ]);
   if (!hierarchyRows.length) {
     return null;
@@ -1291,23 +1497,23 @@ export const getUserClusters = async (
     return { clusters: [] };
   }
 
-  const clusterIds = new Set<string>();
-  const nameMap = new Map<string, string>();
-  for (const row of hierarchy) {
+  // Cluster id -> display name; also the membership set for level-0 clusters.
+  const clusterNames = new Map<string, string>();
+  const hierarchyEntries = hierarchy.map((row) => {
     const clusterId = sanitizeString(row["cluster_id"]);
-    if (!clusterId) {
-      continue;
-    }
-    clusterIds.add(clusterId);
     const name = sanitizeString(row["name"]) || clusterId;
-    nameMap.set(clusterId, name);
-  }
+    if (clusterId) {
+      clusterNames.set(clusterId, name);
+    }
+    return {
+      clusterId,
+      name,
+      summary: sanitizeString(row["summary"]),
+      lowQuality: sanitizeBoolean(row["low_quality_cluster"]),
+    };
+  });
 
-  const ontologyData = await readJsonFile<Record<string, unknown>>(username, "cluster_ontology_items.json");
-  const labelsData = await readJsonFile<Record<string, unknown>>(username, "cluster_labels.json");
-  const groupData = await readJsonFile<Record<string, unknown>>(username, "group_results.json");
-  const tweetIdMaps =
-    (await readJsonFile<Record<string, Record<string, string>>>(username, "local_tweet_id_maps.json")) ?? {};
+  const tweetIdMaps = tweetIdMapsData ?? {};
 
   const yearlyMap = new Map<string, { period: string; summary: string }[]>();
   const ontologyMap = new Map<string, ClusterOntology>();
@@ -1316,11 +1522,14 @@ export const getUserClusters = async (
     if (!source) {
       return;
     }
-    for (const [key, rawValue] of Object.entries(source)) {
-      const entry = (rawValue ?? {}) as Record<string, unknown>;
+    for (const key in source) {
+      const entry = (source[key] ?? {}) as Record<string, unknown>;
       const clusterKeyRaw = entry["cluster_id"] ?? key;
       const clusterKey = sanitizeString(clusterKeyRaw);
-      if (!clusterKey || !clusterIds.has(clusterKey)) {
+      if (!clusterKey || !clusterNames.has(clusterKey)) {
+        continue;
+      }
+      if (ontologyMap.has(clusterKey) && yearlyMap.has(clusterKey)) {
         continue;
       }
       const container =
@@ -1340,9 +1549,17 @@ export const getUserClusters = async (
   };
 
   ingestOntologySource(ontologyData);
+  // cluster_labels.json is only a fallback, so it is fetched only when the ontology file left gaps.
+  const needsLabels = ontologyMap.size < clusterNames.size || yearlyMap.size < clusterNames.size;
+  const [labelsData, tweetRows] = await Promise.all([
+    needsLabels ? readJsonFile<Record<string, unknown>>(username, "cluster_labels.json") : null,
+    options?.tweetRows ?? loadTweetRows(username),
+  ]);
   ingestOntologySource(labelsData);
 
-  const relatedMap = new Map<string, Map<string, string>>();
+  // Each cluster keeps references to the member maps of the groups it belongs to; the pairwise
+  // expansion is deferred until its related list is emitted.
+  const relatedMap = new Map<string, Map<string, string>[]>();
   if (groupData && typeof groupData === "object") {
     const groups = (groupData as Record<string, unknown>)["groups"];
     if (Array.isArray(groups)) {
@@ -1354,83 +1571,47 @@ export const getUserClusters = async (
         if (!Array.isArray(membersRaw)) {
           continue;
         }
-        const members: { id: string; name: string }[] = [];
+        const members = new Map<string, string>();
         for (const entry of membersRaw) {
           if (!entry || typeof entry !== "object") {
             continue;
           }
           const record = entry as Record<string, unknown>;
           const id = sanitizeString(record["id"]);
-          if (!id || !clusterIds.has(id)) {
+          if (!id || !clusterNames.has(id)) {
             continue;
           }
-          const name = sanitizeString(record["name"]) || nameMap.get(id) || id;
-          members.push({ id, name });
+          const name = sanitizeString(record["name"]) || clusterNames.get(id) || id;
+          members.set(id, name);
         }
-        for (const member of members) {
-          const store = relatedMap.get(member.id) ?? new Map<string, string>();
-          for (const other of members) {
-            if (other.id === member.id) {
-              continue;
-            }
-            store.set(other.id, other.name);
+        for (const memberId of members.keys()) {
+          const groupsForMember = relatedMap.get(memberId);
+          if (groupsForMember) {
+            groupsForMember.push(members);
+          } else {
+            relatedMap.set(memberId, [members]);
           }
-          relatedMap.set(member.id, store);
         }
       }
     }
   }
 
-  const tweetRows = options?.tweetRows ?? (await loadTweetRows(username));
-
-  const statsMap = new Map<
-    string,
-    {
-      likes: number[];
-      totalLikes: number;
-      count: number;
-      timestamps: number[];
-      replies: Map<string, number>;
-      referenceTweets: Map<
-        string,
-        {
-          tweetId: string;
-          username: string;
-          accountId: string;
-          createdAt: string | null;
-          fullText: string;
-          favoriteCount: number;
-        }
-      >;
-    }
-  >();
+  // Every known cluster gets a slot up front, so each row costs a single lookup that doubles as the
+  // membership filter. Stats are only allocated once a cluster is observed; empty clusters stay null.
+  const statsMap = new Map<string, ClusterStats | null>();
+  for (const clusterId of clusterNames.keys()) {
+    statsMap.set(clusterId, null);
+  }
 
   for (const row of tweetRows) {
-    const clusterId = row.clusterId;
-    if (!clusterId || !clusterIds.has(clusterId)) {
+    let stats = statsMap.get(row.clusterId);
+    if (stats === undefined) {
       continue;
     }
-
-    const stats =
-      statsMap.get(clusterId) ??
-      {
-        likes: [] as number[],
-        totalLikes: 0,
-        count: 0,
-        timestamps: [] as number[],
-        replies: new Map<string, number>(),
-        referenceTweets: new Map<
-          string,
-          {
-            tweetId: string;
-            username: string;
-            accountId: string;
-            createdAt: string | null;
-            fullText: string;
-            favoriteCount: number;
-          }
-        >(),
-      };
+    if (stats === null) {
+      stats = createClusterStats();
+      statsMap.set(row.clusterId, stats);
+    }
 
     const favorite = Number.isFinite(row.favoriteCount) ? row.favoriteCount : 0;
     stats.likes.push(favorite);
@@ -1455,8 +1636,6 @@ export const getUserClusters = async (
         favoriteCount: Math.round(favorite),
       });
     }
-
-    statsMap.set(clusterId, stats);
   }
 
   const resolveTweetReferences = (clusterId: string, references: string[]): string[] => {
@@ -1500,13 +1679,12 @@ export const getUserClusters = async (
     };
   };
 
-  const clusters = hierarchy.map((row) => {
-    const clusterId = sanitizeString(row["cluster_id"]);
+  const clusters = hierarchyEntries.map(({ clusterId, name, summary, lowQuality }) => {
     const stats = statsMap.get(clusterId);
     const referencedIds = new Set<string>();
     const remappedOntology = remapOntologyReferences(
       clusterId,
-      ontologyMap.get(clusterId) ?? normalizeOntology({}),
+      ontologyMap.get(clusterId) ?? EMPTY_ONTOLOGY,
       referencedIds,
     );
     const tweetsPerMonth = stats ? buildMonthlyTweetSeries(stats.timestamps) : [];
@@ -1543,28 +1721,33 @@ export const getUserClusters = async (
     }
     const replies =
       stats && stats.replies.size
-        ? Array.from(stats.replies.entries())
-            .sort((a, b) => b[1] - a[1])
-            .slice(0, 5)
-            .map(([usernameEntry, count]) => ({
-              username: usernameEntry,
-              count,
-            }))
+        ? topCounts(stats.replies, 5).map(([usernameEntry, count]) => ({
+            username: usernameEntry,
+            count,
+          }))
         : [];
 
-    const relatedEntries = relatedMap.get(clusterId);
+    const relatedGroups = relatedMap.get(clusterId);
+    let relatedEntries: Map<string, string> | undefined;
+    if (relatedGroups) {
+      relatedEntries = new Map<string, string>();
+      for (const members of relatedGroups) {
+        for (const [id, name] of members) {
+          if (id !== clusterId) {
+            relatedEntries.set(id, name);
+          }
+        }
+      }
+    }
     const relatedClusters = relatedEntries
-      ? Array.from(relatedEntries.entries())
-          .filter(([id]) => clusterIds.has(id))
-          .map(([id, name]) => ({ id, name }))
-          .sort((a, b) => a.name.localeCompare(b.name))
+      ? Array.from(relatedEntries, ([id, name]) => ({ id, name })).sort((a, b) => a.name.localeCompare(b.name))
       : [];
 
     return {
       id: clusterId,
-      name: sanitizeString(row["name"]) || clusterId,
-      summary: sanitizeString(row["summary"]),
-      lowQuality: sanitizeBoolean(row["low_quality_cluster"]),
+      name,
+      summary,
+      lowQuality,
       tweetsCount: stats?.count ?? 0,
       totalLikes: Math.round(stats?.totalLikes ?? 0),
       medianLikes: Math.round(stats ? medianNumber(stats.likes) : 0),
@@ -1589,21 +1772,20 @@ export const getUserClusters = async (
     }
   }
 
-  clusters.sort((a, b) => {
-    const aHasDate = a.medianDate ? 1 : 0;
-    const bHasDate = b.medianDate ? 1 : 0;
-    if (aHasDate !== bHasDate) {
-      return bHasDate - aHasDate;
-    }
-    if (!a.medianDate || !b.medianDate) {
-      return 0;
-    }
-    return Date.parse(b.medianDate) - Date.parse(a.medianDate);
-  });
+  sortByDateDescending(clusters, (cluster) => cluster.medianDate);
 
   return { clusters };
 };
 
+const EMPTY_RECORD: Readonly<Record<string, unknown>> = Object.freeze({});
+
+const normalizeFallbackDate = (raw: unknown): string | null => {
+  if (raw instanceof Date && !Number.isNaN(raw.getTime())) {
+    return raw.toISOString();
+  }
+  return sanitizeString(raw) || null;
+};
+
 const detectRetweet = (text: string) => {
   const snippet = text.trim().toLowerCase();
   return snippet.startsWith("rt @");
@@ -1639,23 +1821,43 @@ const pickLongestPath = (
     return best;
   }
 
-  const stack: string[][] = [[rootId]];
+  const parent = new Map<string, string | null>([[rootId, null]]);
+  const depth = new Map<string, number>([[rootId, 1]]);
+  let deepest = rootId;
+  let deepestDepth = 0;
+
+  const stack: string[] = [rootId];
   while (stack.length) {
-    const current = stack.pop()!;
-    const node = current[current.length - 1];
-    const nextChildren = children[node] ?? [];
-    if (!nextChildren.length) {
-      if (current.length > best.length) {
-        best = current;
+    const node = stack.pop()!;
+    const nodeDepth = depth.get(node) ?? 1;
+    let pushed = 0;
+    for (const child of children[node] ?? []) {
+      if (parent.has(child)) {
+        continue;
       }
-      continue;
+      parent.set(child, node);
+      depth.set(child, nodeDepth + 1);
+      stack.push(child);
+      pushed += 1;
     }
-    for (const child of nextChildren) {
-      stack.push([...current, child]);
+    // A node whose children were all reached already (shared or cyclic links) ends a path here.
+    if (!pushed && nodeDepth > deepestDepth) {
+      deepest = node;
+      deepestDepth = nodeDepth;
     }
   }
 
-  return best.length ? best : fallback;
+  if (!deepestDepth) {
+    return fallback;
+  }
+
+  const path: string[] = new Array(deepestDepth);
+  let cursor: string | null = deepest;
+  for (let index = deepestDepth - 1; index >= 0 && cursor !== null; index -= 1) {
+    path[index] = cursor;
+    cursor = parent.get(cursor) ?? null;
+  }
+  return path;
 };
 
 export const getUserThreads = async (
@@ -1710,10 +1912,10 @@ export const getUserThreads = async (
     });
   }
 
-  const treesData = (await readPickleFile(username, "trees.pkl")) as Record<string, unknown> | null;
-  const incompleteData = (await readPickleFile(username, "incomplete_trees.pkl")) as
-    | Record<string, unknown>
-    | null;
+  const [treesData, incompleteData] = (await Promise.all([
+    readPickleFile(username, "trees.pkl"),
+    readPickleFile(username, "incomplete_trees.pkl"),
+  ])) as [Record<string, unknown> | null, Record<string, unknown> | null];
 
   const combinedRoots = new Map<
     string,
@@ -1792,34 +1994,22 @@ export const getUserThreads = async (
 
     longestPath.forEach((tweetId, index) => {
       const lookup = tweetLookup.get(tweetId);
-      const fallback = tweetsMap[tweetId] ?? {};
+      const rawFallback = tweetsMap[tweetId];
+      const fallback: Record<string, unknown> =
+        rawFallback && typeof rawFallback === "object" ? rawFallback : EMPTY_RECORD;
 
       const accountId =
         lookup?.accountId ||
-        sanitizeString((fallback as Record<string, unknown>)["account_id"]) ||
-        sanitizeString((fallback as Record<string, unknown>)["user_id"]) ||
+        sanitizeString(fallback["account_id"]) ||
+        sanitizeString(fallback["user_id"]) ||
         null;
-      const username = lookup?.username || sanitizeString((fallback as Record<string, unknown>)["username"]);
-      const createdAt =
-        lookup?.createdAt ||
-        (() => {
-          const raw = (fallback as Record<string, unknown>)["created_at"];
-          if (raw instanceof Date && !Number.isNaN(raw.getTime())) {
-            return raw.toISOString();
-          }
-          const text = sanitizeString(raw);
-          return text || null;
-        })();
-      const fullText =
-        lookup?.fullText || sanitizeString((fallback as Record<string, unknown>)["full_text"]);
-      const favoriteCount =
-        lookup?.favoriteCount ?? Math.round(sanitizeNumber((fallback as Record<string, unknown>)["favorite_count"]));
-      const replyTo =
-        lookup?.replyToTweetId || sanitizeString((fallback as Record<string, unknown>)["reply_to_tweet_id"]);
-      const clusterId =
-        lookup?.cluster || sanitizeString((fallback as Record<string, unknown>)["cluster"]);
-      const clusterProb =
-        lookup?.clusterProb ?? sanitizeNumber((fallback as Record<string, unknown>)["cluster_prob"]);
+      const username = lookup?.username || sanitizeString(fallback["username"]);
+      const createdAt = lookup?.createdAt || normalizeFallbackDate(fallback["created_at"]);
+      const fullText = lookup?.fullText || sanitizeString(fallback["full_text"]);
+      const favoriteCount = lookup?.favoriteCount ?? Math.round(sanitizeNumber(fallback["favorite_count"]));
+      const replyTo = lookup?.replyToTweetId || sanitizeString(fallback["reply_to_tweet_id"]);
+      const clusterId = lookup?.cluster || sanitizeString(fallback["cluster"]);
+      const clusterProb = lookup?.clusterProb ?? sanitizeNumber(fallback["cluster_prob"]);
 
       const isReply = Boolean(replyTo);
       const isRetweet = detectRetweet(fullText);
@@ -1892,17 +2082,7 @@ export const getUserThreads = async (
     }
   }
 
-  threads.sort((a, b) => {
-    const aHasDate = a.rootCreatedAt ? 1 : 0;
-    const bHasDate = b.rootCreatedAt ? 1 : 0;
-    if (aHasDate !== bHasDate) {
-      return bHasDate - aHasDate;
-    }
-    if (!a.rootCreatedAt || !b.rootCreatedAt) {
-      return 0;
-    }
-    return Date.parse(b.rootCreatedAt) - Date.parse(a.rootCreatedAt);
-  });
+  sortByDateDescending(threads, (thread) => thread.rootCreatedAt);
 
   return { threads };
 };
@@ -1950,37 +2130,38 @@ export const getUserEmbeddings = async (
       return null;
     }
 
-    const keptRows: NormalizedTweetRow[] = [];
-    const keptIndices: number[] = [];
+    const isKept = (row: NormalizedTweetRow | undefined): row is NormalizedTweetRow => {
+      const clusterId = row?.clusterId?.trim();
+      return Boolean(clusterId) && clusterId !== "-1";
+    };
 
+    const keptRows: NormalizedTweetRow[] = [];
     for (let index = 0; index < maxAlignedLength; index += 1) {
       const row = tweetRows[index];
-      if (!row) {
-        continue;
+      if (isKept(row)) {
+        keptRows.push(row);
       }
-      const clusterId = row.clusterId?.trim();
-      if (!clusterId || clusterId === "-1") {
-        continue;
-      }
-      keptRows.push(row);
-      keptIndices.push(index);
     }
 
     if (!keptRows.length) {
       return null;
     }
 
+    // The filter pass is repeated for the copy so the buffer can be sized exactly without keeping
+    // an index array of kept rows.
     const constructor =
       npy.data instanceof Float32Array ? Float32Array : Float64Array;
     const filteredValues = new constructor(keptRows.length * dimension);
-
-    for (let position = 0; position < keptIndices.length; position += 1) {
-      const sourceIndex = keptIndices[position]!;
-      const targetBase = position * dimension;
-      const sourceBase = sourceIndex * dimension;
+    let targetBase = 0;
+    for (let index = 0; index < maxAlignedLength; index += 1) {
+      if (!isKept(tweetRows[index])) {
+        continue;
+      }
+      const sourceBase = index * dimension;
       for (let column = 0; column < dimension; column += 1) {
         filteredValues[targetBase + column] = npy.data[sourceBase + column] ?? 0;
       }
+      targetBase += dimension;
     }
 
     const coordinates = projectEmbeddingsTo2D(filteredValues, keptRows.length, dimension);
@@ -2047,16 +2228,21 @@ export const getUserDataBundle = async (
     return null;
   }
 
-  const exists = await ensureUserExists(username);
+  // Trade-off: overlapping the existence probe with the first reads saves a round trip for known users,
+  // at the cost of wasted GetObjects for unknown ones (they 404 to null and no decoder is loaded).
+  // group_results.json is read once here and handed to both the summary and the clusters view.
+  const [exists, tweetRows, groupData] = await Promise.all([
+    ensureUserExists(username),
+    loadTweetRows(username),
+    readJsonFile<Record<string, unknown>>(username, "group_results.json"),
+  ]);
   if (!exists) {
     return null;
   }
 
-  const tweetRows = await loadTweetRows(username);
-
   const [summary, clusters, threads, embeddings] = await Promise.all([
-    getUserSummary(username, { tweetRows, skipExistenceCheck: true }),
-    getUserClusters(username, { tweetRows }),
+    getUserSummary(username, { tweetRows, groupData, skipExistenceCheck: true }),
+    getUserClusters(username, { tweetRows, groupData }),
     getUserThreads(username, { tweetRows }),
     getUserEmbeddings(username, { tweetRows }),
   ]);
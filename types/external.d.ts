@@ -16,8 +16,13 @@ declare module "parquet-wasm/bundler" {
     free?(): void;
   };
 
+  export type ReaderOptions = {
+    columns?: string[];
+  };
+
   export function readParquet(
     source: Buffer | Uint8Array | ArrayBuffer,
+    options?: ReaderOptions,
   ): ParquetTable;
 }
 
@@ -34,10 +39,16 @@ declare module "apache-arrow" {
     [key: string]: unknown;
   }
 
+  export interface ArrowVector {
+    length: number;
+    get(index: number): unknown;
+  }
+
   export interface ArrowTable extends Iterable<ArrowRow> {
     numRows: number;
     schema: ArrowSchema;
     get(index: number): ArrowRow;
+    getChild(name: string): ArrowVector | null;
   }
 
   export function tableFromIPC(